@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# Time from process start to the first lit frame, with and without the raw boot frame cache
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = int(os.environ.get("BENCH_RUNS", 10))
+
+# Runs main.py with the strip stubbed out: the first show() reports the time and ends the process
+CHILD = f"""
+import os, sys, time
+import rpi_ws281x
+
+leds = {{}}
+
+def setPixelColor(self, n, color):
+    leds[n] = color
+
+def show(self):
+    print(time.time(), "PIL" in sys.modules, flush=True)
+    os._exit(0)
+
+rpi_ws281x.PixelStrip.begin = lambda self: None
+rpi_ws281x.PixelStrip.setPixelColor = setPixelColor
+rpi_ws281x.PixelStrip.show = show
+sys.path.insert(0, {ROOT!r})
+from main import LEDServer
+LEDServer().run()
+"""
+
+
+def time_to_first_frame(boot_frame_cache: str) -> tuple:
+    env = dict(
+        os.environ,
+        LEDSERVER_BOOT_IMAGE=os.path.join(ROOT, "pattern.png"),
+        LEDSERVER_BOOT_FRAME_CACHE=boot_frame_cache,
+    )
+    start = time.time()
+    result = subprocess.run([sys.executable, "-c", CHILD], env=env, capture_output=True, text=True, check=True)
+    (first_frame, pil_imported) = result.stdout.split()
+    return (float(first_frame) - start, pil_imported == "True")
+
+
+def report(name: str, boot_frame_cache: str, pil_expected: bool) -> None:
+    timings = []
+    for run in range(RUNS):
+        (elapsed, pil_imported) = time_to_first_frame(boot_frame_cache)
+        if pil_imported != pil_expected:
+            raise RuntimeError(f"{name} run {run}: Pillow imported is {pil_imported}, expected {pil_expected}")
+        timings.append(elapsed * 1000)
+    print(
+        f"{name:<10} median {statistics.median(timings):7.1f} ms  min {min(timings):7.1f} ms  "
+        f"(Pillow imported: {pil_expected})"
+    )
+
+
+def main() -> None:
+    sys.path.insert(0, ROOT)
+    from ledmatrix import LEDMatrix
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        boot_frame_cache = os.path.join(tmpdir, "pattern.bin")
+        print(f"Time to first frame over {RUNS} runs")
+        report("png", boot_frame_cache, pil_expected=True)
+        LEDMatrix.saveRawFrame(LEDMatrix.loadImage(os.path.join(ROOT, "pattern.png")), boot_frame_cache)
+        report("raw cache", boot_frame_cache, pil_expected=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,23 @@
-from ledmatrix.ledframe import LedFrame
-from ledmatrix.ledmatrix import LEDMatrix
-from ledmatrix.network_frame import ImageFrame, CommandFrame, Command, FrameException
-from ledmatrix.stream_manager import StreamManager
+# Submodules are imported on first use, so importing one class doesn't pay for all of them
+import importlib
+
+_EXPORTS = {
+    "LedFrame": "ledmatrix.ledframe",
+    "LEDMatrix": "ledmatrix.ledmatrix",
+    "ImageFrame": "ledmatrix.network_frame",
+    "TimedImageFrame": "ledmatrix.network_frame",
+    "CommandFrame": "ledmatrix.network_frame",
+    "Command": "ledmatrix.network_frame",
+    "FrameException": "ledmatrix.network_frame",
+    "StreamManager": "ledmatrix.stream_manager",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
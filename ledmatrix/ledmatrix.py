@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 # Interface to the LED Matrix
 
+from array import array
+import mmap
+import os
+import tempfile
+
 from rpi_ws281x import PixelStrip, Color
 import _rpi_ws281x as ws
-from PIL import Image
 
 from ledmatrix.ledframe import LedFrame
 
@@ -56,6 +60,9 @@ class LEDMatrix:
 
     @staticmethod
     def loadImage(file: str) -> LedFrame:
+        # Pillow is slow to import, and only needed here
+        from PIL import Image
+
         img = Image.open(file).convert("RGB")
         img.load()
         image_frame = LedFrame(img.height, img.width)
@@ -65,16 +72,57 @@ class LEDMatrix:
                 image_frame.pixels.append(Color(*pixel))
         return image_frame
 
-    def displayFrame(self, frame: LedFrame) -> None:
-        if frame.height != self.MATRIX_HEIGHT or frame.width != self.MATRIX_WIDTH:
+    @classmethod
+    def __checkFrameSize(cls, frame: LedFrame) -> None:
+        if frame.height != cls.MATRIX_HEIGHT or frame.width != cls.MATRIX_WIDTH:
             raise Exception(
                 "Frame is for %i x %i Matrix but we have %i x %i"
-                % (frame.width, frame.height, self.MATRIX_WIDTH, self.MATRIX_HEIGHT)
+                % (frame.width, frame.height, cls.MATRIX_WIDTH, cls.MATRIX_HEIGHT)
             )
+
+    @classmethod
+    def __panelIndex(cls, x: int, y: int) -> int:
+        """Position along the strip of pixel (x, y) - columns are wired in alternating directions"""
+        matrix_y = y
+        if not x % 2:
+            matrix_y = cls.MATRIX_HEIGHT - y - 1
+        return matrix_y + x * cls.MATRIX_HEIGHT
+
+    def displayFrame(self, frame: LedFrame) -> None:
+        self.__checkFrameSize(frame)
         for y in range(self.MATRIX_HEIGHT):
             for x in range(self.MATRIX_WIDTH):
-                matrix_y = y
-                if not x % 2:
-                    matrix_y = self.MATRIX_HEIGHT - y - 1
-                self.strip.setPixelColor(matrix_y + x * self.MATRIX_HEIGHT, frame.pixels[frame.width * y + x])
+                self.strip.setPixelColor(self.__panelIndex(x, y), frame.pixels[frame.width * y + x])
+        self.strip.show()
+
+    @classmethod
+    def saveRawFrame(cls, frame: LedFrame, file: str) -> None:
+        """Writes the frame in strip order as native 32-bit colours, ready for displayRawFrame"""
+        cls.__checkFrameSize(frame)
+        panel_pixels = array("I", bytes(4 * cls.MATRIX_HEIGHT * cls.MATRIX_WIDTH))
+        for y in range(cls.MATRIX_HEIGHT):
+            for x in range(cls.MATRIX_WIDTH):
+                panel_pixels[cls.__panelIndex(x, y)] = frame.pixels[frame.width * y + x]
+        # Write alongside the destination then swap it in, so a partial write never leaves a short cache behind
+        (fd, tmp_file) = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file)))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                panel_pixels.tofile(f)
+            # mkstemp creates the file owner-only, but the cache may live in a bind-mounted checkout
+            os.chmod(tmp_file, 0o644)
+            os.replace(tmp_file, file)
+        except BaseException:
+            os.unlink(tmp_file)
+            raise
+
+    def displayRawFrame(self, file: str) -> None:
+        """Memory-maps a frame written by saveRawFrame and pushes it straight to the strip"""
+        with open(file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+            with memoryview(raw).cast("I") as panel_pixels:
+                if len(panel_pixels) != self.strip.numPixels():
+                    raise Exception(
+                        "Raw frame has %i pixels but we have %i" % (len(panel_pixels), self.strip.numPixels())
+                    )
+                for i, color in enumerate(panel_pixels):
+                    self.strip.setPixelColor(i, color)
         self.strip.show()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import struct
+from typing import Iterator
 
 
 class FrameException(Exception):
@@ -74,7 +75,12 @@ class ImageFrame(NetworkFrame):
 
     @classmethod
     def from_bytes(cls, source_bytes: bytes):
-        (ident, height, width, pixeldata_size) = struct.unpack("HHHH", source_bytes[0 : cls.HEADER_SIZE])
+        if len(source_bytes) < cls.HEADER_SIZE:
+            raise FrameException(
+                f"Cannot parse image frame, expected at least {cls.HEADER_SIZE} header bytes but got {len(source_bytes)}"
+            )
+
+        (ident, height, width, pixeldata_size) = struct.unpack("HHHH", source_bytes[0 : ImageFrame.HEADER_SIZE])
 
         if ident != cls.IDENT:
             raise FrameException(f"Cannot parse image frame, IDENT should be 0x{cls.IDENT:x} but got 0x{ident:x}")
@@ -92,10 +98,53 @@ class ImageFrame(NetworkFrame):
 
         return cls(width=width, height=height, pixels=pixeldata)
 
+    def crop(self, x: int, y: int, width: int, height: int) -> ImageFrame:
+        """Returns a new frame containing the width x height region whose top-left pixel is at (x, y)"""
+        if x < 0 or y < 0 or x + width > self.width or y + height > self.height:
+            raise FrameException(
+                f"Cannot crop {width} x {height} region at ({x}, {y}) from {self.width} x {self.height} frame"
+            )
+        row_size = width * self.PIXEL_SIZE
+        pixeldata = bytearray()
+        for row in range(y, y + height):
+            start = (row * self.width + x) * self.PIXEL_SIZE
+            pixeldata += self.pixels[start : start + row_size]
+        return replace(self, height=height, width=width, pixels=bytes(pixeldata))
+
+
+@dataclass
+class TimedImageFrame(ImageFrame):
+    """An ImageFrame which should not be displayed before present_at (seconds since the epoch)"""
+
+    present_at: float = 0.0
+    IDENT: int = field(repr=False, init=False, default=0x1235)
+    HEADER_SIZE: int = field(repr=False, init=False, default=16)
+
+    @property
+    def header(self) -> bytes:
+        present_at_us = round(self.present_at * 1_000_000)
+        if not 0 <= present_at_us < 2**64:
+            raise FrameException(f"Cannot build timed image frame, present_at ({self.present_at}) is out of range")
+        return super().header + struct.pack("Q", present_at_us)
+
+    @classmethod
+    def from_bytes(cls, source_bytes: bytes):
+        frame = super().from_bytes(source_bytes)
+        (present_at_us,) = struct.unpack("Q", source_bytes[ImageFrame.HEADER_SIZE : cls.HEADER_SIZE])
+        frame.present_at = present_at_us / 1_000_000
+        return frame
+
+
+def _frame_types(base: type = NetworkFrame) -> Iterator[type]:
+    """Yields every frame class derived from base, including subclasses of subclasses"""
+    for cls in base.__subclasses__():
+        yield cls
+        yield from _frame_types(cls)
+
 
 def parse_frame(source_bytes: bytes) -> NetworkFrame:
     frame_type = struct.unpack("H", source_bytes[0:2])[0]
-    for cls in NetworkFrame.__subclasses__():
+    for cls in _frame_types():
         if frame_type == cls.IDENT:
             return cls.from_bytes(source_bytes=source_bytes)
     raise FrameException(f"Unknown frame IDENT (0x{frame_type:x})")
@@ -3,7 +3,7 @@ import datetime
 import logging
 import threading
 import time
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 
 from ledmatrix.ledframe import LedFrame
 from ledmatrix.ledmatrix import LEDMatrix
@@ -11,6 +11,7 @@ from ledmatrix.tcpserver import TCPServer
 from ledmatrix.udpserver import UDPServer
 from ledmatrix.network_frame import (
     ImageFrame,
+    TimedImageFrame,
     CommandFrame,
     Command,
     NetworkFrame,
@@ -19,6 +20,7 @@ from ledmatrix.network_frame import (
 
 
 DEFAULT_PRIORITY = 5
+MAX_PRESENTATION_DELAY = 1.0  # Seconds - TimedImageFrames further in the future than this are dropped
 
 
 @dataclass
@@ -35,15 +37,72 @@ class StreamManager:
     udp_server: UDPServer
     leds: LEDMatrix
     timeout: int
+    region: Optional[Tuple[int, int]]
+    last_present_at: Optional[float]
+    skewed_clients: Set[str]
     frame_lock: threading.Lock
 
-    def __init__(self, port: int, timeout: int, leds: LEDMatrix) -> None:
+    def __init__(
+        self,
+        port: int,
+        timeout: int,
+        leds: LEDMatrix,
+        multicast_group: Optional[str] = None,
+        multicast_iface: str = UDPServer.ALL_IFACES,
+        region: Optional[Tuple[int, int]] = None,
+    ) -> None:
         self.streams = []
         self.leds = leds
         self.timeout = timeout
+        # (x, y) offset of this matrix within a larger shared frame, e.g. one panel of a video wall
+        self.region = region
+        self.last_present_at = None
+        self.skewed_clients = set()
         self.frame_lock = threading.Lock()
         self.tcp_server = TCPServer(port=port)
-        self.udp_server = UDPServer(port=port)
+        self.udp_server = UDPServer(port=port, multicast_group=multicast_group, multicast_iface=multicast_iface)
+
+    def __wait_for_presentation(self, frame: TimedImageFrame) -> bool:
+        """Sleep until the frame's presentation time. Returns False if the frame is too far in the future to wait for.
+
+        Such frames are ignored entirely - they don't register or keep alive the sender's stream, so a sender whose
+        clock runs more than MAX_PRESENTATION_DELAY ahead of ours is never shown. This is logged once per client.
+        """
+        client = frame.source[0]
+        delay = frame.present_at - time.time()
+        if delay > MAX_PRESENTATION_DELAY:
+            if client not in self.skewed_clients:
+                self.skewed_clients.add(client)
+                logging.warning(
+                    f"[Stream {client}] Ignoring frames more than {MAX_PRESENTATION_DELAY}s ahead "
+                    f"(this one is due in {delay:.3f}s) - check sender clock"
+                )
+            return False
+        if client in self.skewed_clients:
+            self.skewed_clients.discard(client)
+            logging.info(f"[Stream {client}] Frames are within {MAX_PRESENTATION_DELAY}s again")
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            logging.debug(f"Frame is {-delay:.3f}s past its presentation time")
+        return True
+
+    def __display_frame(self, frame: ImageFrame) -> None:
+        """Crop the frame to our region and send it to the panels, unless a newer timed frame has been shown"""
+        if isinstance(frame, TimedImageFrame):
+            if self.last_present_at is not None and frame.present_at <= self.last_present_at:
+                logging.debug(f"Dropping frame for {frame.present_at}, already displayed {self.last_present_at}")
+                return
+            self.last_present_at = frame.present_at
+
+        if self.region is not None:
+            (x, y) = self.region
+            frame = frame.crop(x, y, self.leds.MATRIX_WIDTH, self.leds.MATRIX_HEIGHT)
+
+        # Take received packet and format for LED panel
+        ledframe = LedFrame(frame.height, frame.width)
+        ledframe.fill_from_bytes(frame.pixels)
+        self.leds.displayFrame(ledframe)
 
     def __ingest_frame(self, frame: NetworkFrame) -> None:
         """Process the incoming frame. If the frame belongs to the active stream, send it to the panels"""
@@ -65,11 +124,8 @@ class StreamManager:
         for stream in self.streams:
             if stream.client == frame.source[0]:
                 stream.last_packet = datetime.datetime.now()
-                if type(frame) is ImageFrame and stream.is_active:
-                    # Take received packet and format for LED panel
-                    ledframe = LedFrame(frame.height, frame.width)
-                    ledframe.fill_from_bytes(frame.pixels)
-                    self.leds.displayFrame(ledframe)
+                if isinstance(frame, ImageFrame) and stream.is_active:
+                    self.__display_frame(frame)
                 elif type(frame) is CommandFrame:
                     if frame.command == Command.SetBrightness:
                         logging.info(f"[Stream {stream.client}] Setting brightness to {frame.value}")
@@ -89,6 +145,8 @@ class StreamManager:
             if stream_index == active_index and stream.is_active == False:
                 logging.info(f"[Stream {stream.client}] I'm the captain now")
                 stream.is_active = True
+                # Presentation times from the previous stream don't apply to this one
+                self.last_present_at = None
             elif stream_index != active_index and stream.is_active == True:
                 logging.info(f"[Stream {stream.client}] kthxbai")
                 stream.is_active = False
@@ -123,6 +181,10 @@ class StreamManager:
         logging.debug(f"sync_clients() => Streams: {self.streams}")
 
     def handle_packet(self, network_frame: NetworkFrame) -> None:
+        # Wait before taking the lock, so commands and other frames aren't held up meanwhile
+        if isinstance(network_frame, TimedImageFrame) and not self.__wait_for_presentation(network_frame):
+            return
+
         try:
             with self.frame_lock:
                 self.__ingest_frame(network_frame)
@@ -4,8 +4,9 @@
 import logging
 import socket
 import socketserver
+import struct
 import threading
-from typing import Callable
+from typing import Callable, Optional
 
 from ledmatrix.network_frame import NetworkFrame, parse_frame
 
@@ -14,12 +15,33 @@ class ThreadedUDPServer(socketserver.ThreadingMixIn, socketserver.UDPServer):
     pass
 
 
+class ThreadedMulticastUDPServer(ThreadedUDPServer):
+    """Shares the port with other listeners on this host, and joins the multicast group once bound"""
+
+    allow_reuse_address = True
+
+    def __init__(self, server_address, RequestHandlerClass, group: str, interface: str) -> None:
+        self.group = group
+        self.interface = interface
+        super().__init__(server_address, RequestHandlerClass)
+
+    def server_bind(self) -> None:
+        if hasattr(socket, "SO_REUSEPORT"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+        membership = struct.pack("4s4s", socket.inet_aton(self.group), socket.inet_aton(self.interface))
+        self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership)
+
+
 class UDPServer:
 
     ALL_IFACES = "0.0.0.0"
 
-    def __init__(self, port: int) -> None:
+    def __init__(self, port: int, multicast_group: Optional[str] = None, multicast_iface: str = ALL_IFACES) -> None:
         self.port = port
+        self.multicast_group = multicast_group
+        self.multicast_iface = multicast_iface
+        self.server = None
 
     def run(self, handler: Callable[[NetworkFrame], None]):
         """Sets the request handling callback function, and starts the UDP server in a new thread"""
@@ -39,8 +61,23 @@ class UDPServer:
                 parsed.source = addr
                 handler(parsed)
 
-        logging.info(f"Starting UDP Server on {self.ALL_IFACES}:{self.port}")
-        server = ThreadedUDPServer((self.ALL_IFACES, self.port), PacketHandler)
-        server_thread = threading.Thread(target=server.serve_forever)
+        if self.multicast_group:
+            logging.info(
+                f"Starting UDP Server on {self.ALL_IFACES}:{self.port} in multicast group {self.multicast_group}"
+            )
+            self.server = ThreadedMulticastUDPServer(
+                (self.ALL_IFACES, self.port), PacketHandler, group=self.multicast_group, interface=self.multicast_iface
+            )
+        else:
+            logging.info(f"Starting UDP Server on {self.ALL_IFACES}:{self.port}")
+            self.server = ThreadedUDPServer((self.ALL_IFACES, self.port), PacketHandler)
+        server_thread = threading.Thread(target=self.server.serve_forever)
         server_thread.daemon = True
         server_thread.start()
+
+    def shutdown(self) -> None:
+        """Stops the UDP server and closes its socket"""
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
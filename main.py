@@ -5,12 +5,17 @@ import os
 import logging
 import signal
 
-from ledmatrix import *
+from ledmatrix import LEDMatrix, StreamManager
 
 
 class LEDServer:
 
     LEDSERVER_PORT = int(os.environ.get("LEDSERVER_PORT", 20304))
+    LEDSERVER_MULTICAST_GROUP = os.environ.get("LEDSERVER_MULTICAST_GROUP")
+    LEDSERVER_MULTICAST_IFACE = os.environ.get("LEDSERVER_MULTICAST_IFACE", "0.0.0.0")
+    LEDSERVER_REGION = os.environ.get("LEDSERVER_REGION")
+    BOOT_IMAGE = os.environ.get("LEDSERVER_BOOT_IMAGE", "/app/pattern.png")
+    BOOT_FRAME_CACHE = os.environ.get("LEDSERVER_BOOT_FRAME_CACHE", "/app/pattern.bin")
     DATA_TIMEOUT_SEC = 3
 
     def __graceful_exit(self):
@@ -28,8 +33,41 @@ class LEDServer:
             level=logging.INFO,
             datefmt="%Y-%m-%d %H:%M:%S",
         )
+        region = None
+        if self.LEDSERVER_REGION:
+            try:
+                (x, y) = self.LEDSERVER_REGION.split(",")
+                region = (int(x), int(y))
+            except ValueError:
+                logging.error(f"Invalid LEDSERVER_REGION '{self.LEDSERVER_REGION}' - expected x,y e.g. 32,0")
+                exit(1)
         self.leds = LEDMatrix()
-        self.stream_manager = StreamManager(port=self.LEDSERVER_PORT, timeout=self.DATA_TIMEOUT_SEC, leds=self.leds)
+        self.stream_manager = StreamManager(
+            port=self.LEDSERVER_PORT,
+            timeout=self.DATA_TIMEOUT_SEC,
+            leds=self.leds,
+            multicast_group=self.LEDSERVER_MULTICAST_GROUP,
+            multicast_iface=self.LEDSERVER_MULTICAST_IFACE,
+            region=region,
+        )
+
+    def __show_boot_frame(self):
+        """Show the boot image, using the raw frame cache unless the image is newer"""
+        try:
+            if os.path.getmtime(self.BOOT_FRAME_CACHE) >= os.path.getmtime(self.BOOT_IMAGE):
+                self.leds.displayRawFrame(self.BOOT_FRAME_CACHE)
+                return
+        except OSError:
+            pass
+        except Exception as e:
+            logging.warning(f"Couldn't load cached boot frame ({e})")
+
+        image = self.leds.loadImage(self.BOOT_IMAGE)
+        self.leds.displayFrame(image)
+        try:
+            self.leds.saveRawFrame(image, self.BOOT_FRAME_CACHE)
+        except OSError as e:
+            logging.warning(f"Couldn't cache boot frame ({e})")
 
     def run(self):
         try:
@@ -42,8 +80,7 @@ class LEDServer:
         signal.signal(signal.SIGINT, self.handle_signal)
 
         try:
-            image = self.leds.loadImage("/app/pattern.png")
-            self.leds.displayFrame(image)
+            self.__show_boot_frame()
         except:
             logging.warning("Couldn't load image")
 
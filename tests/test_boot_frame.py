@@ -0,0 +1,115 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from ledmatrix import LEDMatrix
+from main import LEDServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RAW_FRAME_SIZE = 4 * LEDMatrix.MATRIX_HEIGHT * LEDMatrix.MATRIX_WIDTH
+
+# Shows the boot frame from a valid cache with the strip mocked out, then reports whether Pillow was imported
+CHILD = """
+import os, sys
+from unittest import mock
+from main import LEDServer
+
+server = LEDServer()
+server.leds.strip = mock.Mock()
+server.leds.strip.numPixels.return_value = %i
+server._LEDServer__show_boot_frame()
+print("PIL" in sys.modules, flush=True)
+os._exit(0)
+"""
+
+
+class TestBootFrame(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.boot_image = os.path.join(tmpdir.name, "pattern.png")
+        self.boot_frame_cache = os.path.join(tmpdir.name, "pattern.bin")
+        shutil.copy(os.path.join(ROOT, "pattern.png"), self.boot_image)
+        os.utime(self.boot_image, (1000, 1000))
+
+        for patcher in [
+            mock.patch.object(LEDServer, "BOOT_IMAGE", self.boot_image),
+            mock.patch.object(LEDServer, "BOOT_FRAME_CACHE", self.boot_frame_cache),
+            mock.patch.object(LEDMatrix, "loadImage", wraps=LEDMatrix.loadImage),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.server = LEDServer()
+        self.server.leds.strip = mock.Mock()
+        self.server.leds.strip.numPixels.return_value = LEDMatrix.MATRIX_HEIGHT * LEDMatrix.MATRIX_WIDTH
+
+    def write_cache(self, data: bytes = None, mtime: int = 2000):
+        if data is None:
+            LEDMatrix.saveRawFrame(LEDMatrix.loadImage(self.boot_image), self.boot_frame_cache)
+            LEDMatrix.loadImage.reset_mock()
+        else:
+            with open(self.boot_frame_cache, "wb") as f:
+                f.write(data)
+        os.utime(self.boot_frame_cache, (mtime, mtime))
+
+    def show_boot_frame(self):
+        self.server._LEDServer__show_boot_frame()
+        self.server.leds.strip.show.assert_called_once()
+
+    def assert_rebuilt_from_image(self):
+        LEDMatrix.loadImage.assert_called_once_with(self.boot_image)
+        self.assertEqual(os.path.getsize(self.boot_frame_cache), RAW_FRAME_SIZE)
+        self.assertGreater(os.path.getmtime(self.boot_frame_cache), os.path.getmtime(self.boot_image))
+
+    def test_cache_missing(self):
+        self.show_boot_frame()
+        self.assert_rebuilt_from_image()
+
+    def test_cache_hit(self):
+        self.write_cache()
+        self.show_boot_frame()
+        LEDMatrix.loadImage.assert_not_called()
+        self.assertEqual(self.server.leds.strip.setPixelColor.call_count, RAW_FRAME_SIZE // 4)
+
+    def test_image_newer_than_cache(self):
+        self.write_cache(mtime=500)
+        self.show_boot_frame()
+        self.assert_rebuilt_from_image()
+
+    def test_cache_empty(self):
+        self.write_cache(b"")
+        self.show_boot_frame()
+        self.assert_rebuilt_from_image()
+
+    def test_cache_wrong_size(self):
+        self.write_cache(b"\x00" * (RAW_FRAME_SIZE // 2))
+        self.show_boot_frame()
+        self.assert_rebuilt_from_image()
+
+    def test_cache_corrupt(self):
+        # Not a whole number of pixels
+        self.write_cache(b"\x00" * (RAW_FRAME_SIZE - 1))
+        self.show_boot_frame()
+        self.assert_rebuilt_from_image()
+
+    def test_cache_hit_does_not_import_pillow(self):
+        self.write_cache()
+        env = dict(os.environ, LEDSERVER_BOOT_IMAGE=self.boot_image, LEDSERVER_BOOT_FRAME_CACHE=self.boot_frame_cache)
+        result = subprocess.run(
+            [sys.executable, "-c", CHILD % (RAW_FRAME_SIZE // 4)],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
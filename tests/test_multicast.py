@@ -0,0 +1,129 @@
+import socket
+import threading
+import time
+import unittest
+
+from ledmatrix.network_frame import ImageFrame, TimedImageFrame, CommandFrame, Command
+from ledmatrix.stream_manager import StreamManager, MAX_PRESENTATION_DELAY
+
+MULTICAST_GROUP = "239.255.43.21"
+LOOPBACK = "127.0.0.1"
+PIXELS = b"\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x04\x00\x00\x00"
+
+
+def free_udp_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind((LOOPBACK, 0))
+        return s.getsockname()[1]
+
+
+class FakeLEDMatrix:
+    MATRIX_HEIGHT = 1
+    MATRIX_WIDTH = 2
+
+    def __init__(self):
+        self.frames = []
+        self.displayed = threading.Event()
+
+    def setBrightness(self, brightness):
+        pass
+
+    def clearScreen(self):
+        pass
+
+    def displayFrame(self, frame):
+        self.frames.append((time.time(), frame))
+        self.displayed.set()
+
+
+class TestRegion(unittest.TestCase):
+    def setUp(self):
+        self.leds = FakeLEDMatrix()
+        self.stream_manager = StreamManager(port=0, timeout=5, leds=self.leds, region=(2, 0))
+        # The first packet from a client only registers its stream
+        self.handle(CommandFrame(command=Command.SetPriority, value=5))
+
+    def handle(self, frame):
+        frame.source = (LOOPBACK, 12345)
+        self.stream_manager.handle_packet(frame)
+
+    def test_untimed_frame_is_cropped(self):
+        self.handle(ImageFrame(height=1, width=4, pixels=PIXELS))
+        self.assertEqual(len(self.leds.frames), 1)
+        self.assertEqual(self.leds.frames[0][1].pixels, [0x030000, 0x040000])
+
+    def test_default_timed_frame_is_displayed(self):
+        self.handle(TimedImageFrame(height=1, width=4, pixels=PIXELS))
+        self.assertEqual(len(self.leds.frames), 1)
+
+    def test_out_of_order_timed_frame_is_dropped(self):
+        now = time.time()
+        self.handle(TimedImageFrame(height=1, width=4, pixels=PIXELS, present_at=now - 0.1))
+        self.handle(TimedImageFrame(height=1, width=4, pixels=PIXELS, present_at=now - 0.2))
+        self.assertEqual(len(self.leds.frames), 1)
+
+    def test_far_future_timed_frame_is_dropped(self):
+        present_at = time.time() + MAX_PRESENTATION_DELAY + 60
+        started = time.time()
+        self.handle(TimedImageFrame(height=1, width=4, pixels=PIXELS, present_at=present_at))
+        self.assertLess(time.time() - started, MAX_PRESENTATION_DELAY)
+        self.assertEqual(len(self.leds.frames), 0)
+
+    def test_far_future_timed_frames_warn_once(self):
+        present_at = time.time() + MAX_PRESENTATION_DELAY + 60
+        with self.assertLogs(level="WARNING") as logs:
+            for _ in range(3):
+                self.handle(TimedImageFrame(height=1, width=4, pixels=PIXELS, present_at=present_at))
+        self.assertEqual(len(logs.records), 1)
+
+
+class TestMulticast(unittest.TestCase):
+    def setUp(self):
+        self.port = free_udp_port()
+        self.nodes = []
+        for region in [(0, 0), (2, 0)]:
+            leds = FakeLEDMatrix()
+            stream_manager = StreamManager(
+                port=self.port,
+                timeout=5,
+                leds=leds,
+                multicast_group=MULTICAST_GROUP,
+                multicast_iface=LOOPBACK,
+                region=region,
+            )
+            stream_manager.udp_server.run(handler=stream_manager.handle_packet)
+            self.nodes.append((stream_manager, leds))
+
+        self.sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sender.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(LOOPBACK))
+        self.sender.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+
+    def tearDown(self):
+        self.sender.close()
+        for (stream_manager, _) in self.nodes:
+            stream_manager.udp_server.shutdown()
+
+    def send(self, frame):
+        self.sender.sendto(bytes(frame), (MULTICAST_GROUP, self.port))
+
+    def test_nodes_display_their_region_together(self):
+        # The first packet from a client only registers its stream
+        self.send(CommandFrame(command=Command.SetPriority, value=5))
+        time.sleep(0.2)
+
+        present_at = time.time() + 0.3
+        self.send(TimedImageFrame(height=1, width=4, pixels=PIXELS, present_at=present_at))
+
+        for (_, leds) in self.nodes:
+            self.assertTrue(leds.displayed.wait(timeout=2), "Frame was never displayed")
+
+        (left_time, left_frame) = self.nodes[0][1].frames[0]
+        (right_time, right_frame) = self.nodes[1][1].frames[0]
+        self.assertEqual(left_frame.pixels, [0x010000, 0x020000])
+        self.assertEqual(right_frame.pixels, [0x030000, 0x040000])
+        self.assertGreaterEqual(left_time, present_at)
+        self.assertGreaterEqual(right_time, present_at)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,7 @@
 import struct
 import unittest
 
-from ledmatrix.network_frame import ImageFrame, CommandFrame, Command, parse_frame, FrameException
+from ledmatrix.network_frame import ImageFrame, TimedImageFrame, CommandFrame, Command, parse_frame, FrameException
 
 TEST_BRIGHTNESS_CMD = struct.pack(
   "HBB",
@@ -62,6 +62,32 @@ class TestNetworkFrame(unittest.TestCase):
         blob = bytes.fromhex("3412010002000800ffffffffffffffffff")
         self.assertRaises(FrameException, parse_frame, blob)
 
+    def test_parse_frame_timed_image_header_too_short(self):
+        blob = struct.pack("HHHH", TimedImageFrame.IDENT, 0, 0, 0)
+        self.assertRaises(FrameException, parse_frame, blob)
+
+    def test_timed_image_frame_negative_present_at(self):
+        test_frame = TimedImageFrame(height=1, width=2, pixels=b"\xff\x00\xff\xff" * 2, present_at=-1.0)
+        self.assertRaises(FrameException, bytes, test_frame)
+
+    def test_timed_image_frame_round_trip(self):
+        test_frame = TimedImageFrame(height=1, width=2, pixels=b"\xff\x00\xff\xff" * 2, present_at=1234.5)
+        parsed = parse_frame(bytes(test_frame))
+        self.assertIsInstance(parsed, TimedImageFrame)
+        self.assertEqual(parsed.present_at, 1234.5)
+        self.assertEqual(parsed.pixels, test_frame.pixels)
+
+    def test_image_frame_crop(self):
+        pixels = bytes(range(4 * 3 * 2))
+        test_frame = ImageFrame(height=2, width=3, pixels=pixels)
+        cropped = test_frame.crop(1, 1, 2, 1)
+        self.assertEqual((cropped.height, cropped.width), (1, 2))
+        self.assertEqual(cropped.pixels, pixels[16:24])
+
+    def test_image_frame_crop_out_of_bounds(self):
+        test_frame = ImageFrame(height=1, width=2, pixels=b"\x00" * 8)
+        self.assertRaises(FrameException, test_frame.crop, 1, 0, 2, 1)
+
     def test_image_frame_cast_to_bytes(self):
         test_frame = ImageFrame(height=1, width=2, pixels=b"\xff\x00\xff\xff"*2)
         self.assertEqual(bytes(test_frame), TEST_IMAGE_FRAME)
@@ -1,4 +1,5 @@
-import unittest, hashlib
+import unittest, hashlib, os, tempfile
+from unittest import mock
 
 from ledmatrix import LEDMatrix, LedFrame
 
@@ -22,5 +23,44 @@ class TestImage(unittest.TestCase):
       pixel_hash.update(str(pixel).encode())
     self.assertEqual(pixel_hash.hexdigest(), 'cd53df33f8e688061f61b3e8fbe1713c', "Failed to decode image - pixel data mismatch")
 
+
+class TestRawFrame(unittest.TestCase):
+
+  def setUp(self):
+    self.image_frame = LEDMatrix.loadImage('pattern.png')
+    self.matrix = LEDMatrix()
+    self.matrix.strip = mock.Mock()
+    self.matrix.strip.numPixels.return_value = LEDMatrix.MATRIX_HEIGHT * LEDMatrix.MATRIX_WIDTH
+
+  def test_raw_frame_matches_image(self):
+    self.matrix.displayFrame(self.image_frame)
+    expected_calls = self.matrix.strip.setPixelColor.call_args_list
+    self.matrix.strip.reset_mock()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+      raw_file = os.path.join(tmpdir, 'pattern.bin')
+      LEDMatrix.saveRawFrame(self.image_frame, raw_file)
+      self.matrix.displayRawFrame(raw_file)
+
+    self.assertCountEqual(self.matrix.strip.setPixelColor.call_args_list, expected_calls)
+    self.matrix.strip.show.assert_called_once()
+
+  def test_save_raw_frame_replaces_existing(self):
+    with tempfile.TemporaryDirectory() as tmpdir:
+      raw_file = os.path.join(tmpdir, 'pattern.bin')
+      with open(raw_file, 'wb') as f:
+        f.write(b'\x00' * 16)
+      LEDMatrix.saveRawFrame(self.image_frame, raw_file)
+      self.assertEqual(os.listdir(tmpdir), ['pattern.bin'])
+      self.assertEqual(os.path.getsize(raw_file), 4 * LEDMatrix.MATRIX_HEIGHT * LEDMatrix.MATRIX_WIDTH)
+      self.assertEqual(os.stat(raw_file).st_mode & 0o777, 0o644)
+
+  def test_raw_frame_wrong_size(self):
+    with tempfile.TemporaryDirectory() as tmpdir:
+      raw_file = os.path.join(tmpdir, 'pattern.bin')
+      with open(raw_file, 'wb') as f:
+        f.write(b'\x00' * 16)
+      self.assertRaises(Exception, self.matrix.displayRawFrame, raw_file)
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()